@@ -27,6 +27,8 @@ import (
 //go:embed version.txt
 var version string
 
+var multiSpaceRegexp = regexp.MustCompile(" {2,}")
+
 // App struct
 type App struct {
 	debug    bool
@@ -92,7 +94,9 @@ func (a *App) UploadSydneyImage() (UploadSydneyImageResult, error) {
 	if err != nil {
 		return UploadSydneyImageResult{}, err
 	}
-	url, err := sydneyIns.UploadImage(jpgData)
+	url, err := util.Retry(a.ctx, 3, func() (string, error) {
+		return sydneyIns.UploadImage(jpgData)
+	})
 	if err != nil {
 		return UploadSydneyImageResult{}, err
 	}
@@ -140,9 +144,7 @@ func (a *App) UploadDocument() (UploadSydneyDocumentResult, error) {
 	}
 	text := s
 	if !docReader.WillSkipPostprocess() {
-		text = strings.ReplaceAll(text, "\r", "")
-		text = regexp.MustCompile("(?m)^\r+").ReplaceAllString(text, "")
-		text = regexp.MustCompile("\n+").ReplaceAllString(text, "\n")
+		text = util.NormalizeNewlines(text)
 		v, err := json.Marshal(&text)
 		if err != nil {
 			return UploadSydneyDocumentResult{}, err
@@ -178,7 +180,7 @@ func (a *App) FetchWebpage(url string) (FetchWebpageResult, error) {
 		doc.Find("script").Remove()
 		doc.Find("style").Remove()
 		text := bluemonday.StripTagsPolicy().Sanitize(doc.Text())
-		text = regexp.MustCompile(" {2,}").ReplaceAllString(text, "  ")
+		text = multiSpaceRegexp.ReplaceAllString(text, "  ")
 		lines := slices.Filter(strings.Split(text, "\n"), func(s string) bool {
 			return strings.TrimSpace(s) != ""
 		})
@@ -93,7 +93,14 @@ func (a *App) askSydney(options AskOptions) {
 		}
 		return
 	}
-	conversation, err := sydneyIns.CreateConversation()
+	// listen for stop before creating the conversation, so that retries can be canceled too
+	stopCtx, cancel := util.CreateCancelContext()
+	defer cancel()
+	runtime.EventsOn(a.ctx, EventChatStop, func(optionalData ...interface{}) {
+		slog.Info("Received EventChatStop")
+		cancel()
+	})
+	conversation, err := util.Retry(stopCtx, 3, sydneyIns.CreateConversation)
 	if err != nil {
 		chatFinishResult = ChatFinishResult{
 			Success: false,
@@ -103,12 +110,6 @@ func (a *App) askSydney(options AskOptions) {
 		return
 	}
 	runtime.EventsEmit(a.ctx, EventConversationCreated)
-	stopCtx, cancel := util.CreateCancelContext()
-	defer cancel()
-	runtime.EventsOn(a.ctx, EventChatStop, func(optionalData ...interface{}) {
-		slog.Info("Received EventChatStop")
-		cancel()
-	})
 	ch := sydneyIns.AskStream(sydney.AskStreamOptions{
 		StopCtx:        stopCtx,
 		Conversation:   conversation,
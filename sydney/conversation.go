@@ -33,7 +33,10 @@ func (o *Sydney) CreateConversation() (CreateConversationResponse, error) {
 		return CreateConversationResponse{}, err
 	}
 	if resp.StatusCode != 200 {
-		return CreateConversationResponse{}, errors.New("Authentication failed: " + string(bodyV))
+		return CreateConversationResponse{}, &util.HTTPStatusError{
+			StatusCode: resp.StatusCode,
+			Message:    "Authentication failed: " + string(bodyV),
+		}
 	}
 	var response CreateConversationResponse
 	err = json.Unmarshal(bodyV, &response)
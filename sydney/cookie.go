@@ -9,6 +9,8 @@ import (
 	"time"
 )
 
+var userTitleRegexp = regexp.MustCompile(`data-clarity-mask="true" title="(.*?)"`)
+
 func (o *Sydney) GetUser() (string, error) {
 	hClient, err := util.MakeHTTPClient(o.proxy, 0)
 	if err != nil {
@@ -34,7 +36,7 @@ func (o *Sydney) GetUser() (string, error) {
 		return "", errors.New("http status code is not 200: " + strconv.Itoa(resp.StatusCode()))
 	}
 	respText := string(resp.Body())
-	arr := regexp.MustCompile(`data-clarity-mask="true" title="(.*?)"`).FindStringSubmatch(respText)
+	arr := userTitleRegexp.FindStringSubmatch(respText)
 	if len(arr) < 2 {
 		return "", errors.New("cannot identify current user, please check if cookie is expired")
 	}
@@ -10,6 +10,11 @@ import (
 	"time"
 )
 
+var (
+	imageCreationResultRegexp = regexp.MustCompile("/images/create/async/results/(.*?)\\?")
+	generatedImageRegexp      = regexp.MustCompile(`<img class="mimg".*?src="(.*?)"`)
+)
+
 func (o *Sydney) GenerateImage(generativeImage GenerativeImage) (GenerateImageResult, error) {
 	start := time.Now()
 	var empty GenerateImageResult
@@ -24,12 +29,11 @@ func (o *Sydney) GenerateImage(generativeImage GenerativeImage) (GenerateImageRe
 	if err != nil && !errors.Is(err, resty.ErrAutoRedirectDisabled) {
 		return empty, err
 	}
-	arr := regexp.MustCompile("/images/create/async/results/(.*?)\\?").FindStringSubmatch(string(resp.Body()))
+	arr := imageCreationResultRegexp.FindStringSubmatch(string(resp.Body()))
 	if len(arr) < 2 {
 		return empty, errors.New("cannot find image creation result")
 	}
 	resultID := arr[1]
-	re := regexp.MustCompile(`<img class="mimg".*?src="(.*?)"`)
 	u := "https://www.bing.com/images/create/async/results/" + resultID +
 		"?q=" + url.QueryEscape(generativeImage.Text) + "&partner=sydney&showselective=1&IID=images.as"
 	slog.Info("Result URL", "v", u)
@@ -40,7 +44,7 @@ func (o *Sydney) GenerateImage(generativeImage GenerativeImage) (GenerateImageRe
 			return empty, err
 		}
 		var imageURLs []string
-		arr := re.FindAllStringSubmatch(string(resp.Body()), -1)
+		arr := generatedImageRegexp.FindAllStringSubmatch(string(resp.Body()), -1)
 		if len(arr) == 0 {
 			slog.Info("No matched images currently", "body", string(resp.Body()))
 			continue
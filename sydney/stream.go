@@ -3,11 +3,12 @@ package sydney
 import (
 	"encoding/json"
 	"errors"
-	"fmt"
 	"log"
 	"log/slog"
 	"net/http"
 	"net/url"
+	"slices"
+	"strconv"
 	"strings"
 	"sydneyqt/util"
 	"time"
@@ -27,10 +28,12 @@ func (o *Sydney) AskStream(options AskStreamOptions) <-chan Message {
 		}()
 		wrote := 0
 		sendSuggestedResponses := func(message gjson.Result) {
-			if message.Get("suggestedResponses").Exists() {
-				arr := util.Map(message.Get("suggestedResponses").Array(), func(v gjson.Result) string {
-					return v.Get("text").String()
-				})
+			if suggestedResponses := message.Get("suggestedResponses"); suggestedResponses.Exists() {
+				responses := suggestedResponses.Array()
+				arr := make([]string, len(responses))
+				for i, v := range responses {
+					arr[i] = v.Get("text").String()
+				}
 				v, _ := json.Marshal(arr)
 				out <- Message{
 					Type: MessageTypeSuggestedResponses,
@@ -40,28 +43,38 @@ func (o *Sydney) AskStream(options AskStreamOptions) <-chan Message {
 		}
 		for msg := range ch {
 			if msg.Error != nil {
-				log.Println("error: " + msg.Error.Error())
+				errMsg := msg.Error.Error()
+				log.Println("error: " + errMsg)
 				out <- Message{
 					Type:  MessageTypeError,
-					Text:  msg.Error.Error(),
+					Text:  errMsg,
 					Error: msg.Error,
 				}
 				return
 			}
 			data := gjson.Parse(msg.Data)
-			if data.Get("type").Int() == 1 && data.Get("arguments.0.messages").Exists() {
-				message := data.Get("arguments.0.messages.0")
-				msgType := message.Get("messageType")
-				messageText := message.Get("text").String()
-				messageHiddenText := message.Get("hiddenText").String()
-				switch msgType.String() {
+			switch data.Get("type").Int() {
+			case 1:
+				// resolve each path once per frame instead of rescanning the frame in every branch
+				argument := data.Get("arguments.0")
+				messages := argument.Get("messages")
+				if !messages.Exists() {
+					continue
+				}
+				message := messages.Get("0")
+				msgType := message.Get("messageType").String()
+				text := message.Get("text")
+				hiddenText := message.Get("hiddenText")
+				messageText := text.String()
+				messageHiddenText := hiddenText.String()
+				switch msgType {
 				case "InternalSearchQuery":
 					out <- Message{
 						Type: MessageTypeSearchQuery,
 						Text: messageHiddenText,
 					}
 				case "InternalSearchResult":
-					var links []string
+					var links strings.Builder
 					if strings.Contains(messageHiddenText,
 						"Web search returned no relevant result") {
 						out <- Message{
@@ -79,8 +92,17 @@ func (o *Sydney) AskStream(options AskStreamOptions) <-chan Message {
 						srIndex := 1
 						group.ForEach(func(key, value gjson.Result) bool {
 							for _, subGroup := range value.Array() {
-								links = append(links, fmt.Sprintf("[^%d^][%s](%s)",
-									srIndex, subGroup.Get("title").String(), subGroup.Get("url").String()))
+								if links.Len() != 0 {
+									links.WriteString("\n\n")
+								}
+								// [^index^][title](url), written piecewise without parsing a format string
+								links.WriteString("[^")
+								links.WriteString(strconv.Itoa(srIndex))
+								links.WriteString("^][")
+								links.WriteString(subGroup.Get("title").String())
+								links.WriteString("](")
+								links.WriteString(subGroup.Get("url").String())
+								links.WriteString(")")
 								srIndex++
 							}
 							return true
@@ -88,17 +110,17 @@ func (o *Sydney) AskStream(options AskStreamOptions) <-chan Message {
 					}
 					out <- Message{
 						Type: MessageTypeSearchResult,
-						Text: strings.Join(links, "\n\n"),
+						Text: links.String(),
 					}
 				case "InternalLoaderMessage":
-					if message.Get("hiddenText").Exists() {
+					if hiddenText.Exists() {
 						out <- Message{
 							Type: MessageTypeLoading,
 							Text: messageHiddenText,
 						}
 						continue
 					}
-					if message.Get("text").Exists() {
+					if text.Exists() {
 						out <- Message{
 							Type: MessageTypeLoading,
 							Text: messageText,
@@ -129,7 +151,7 @@ func (o *Sydney) AskStream(options AskStreamOptions) <-chan Message {
 						Text: string(v),
 					}
 				case "":
-					if data.Get("arguments.0.cursor").Exists() {
+					if argument.Get("cursor").Exists() {
 						wrote = 0
 					}
 					if message.Get("contentOrigin").String() == "Apology" {
@@ -160,10 +182,13 @@ func (o *Sydney) AskStream(options AskStreamOptions) <-chan Message {
 						sendSuggestedResponses(message)
 					}
 				default:
-					log.Println("Unsupported message type: " + msgType.String())
+					log.Println("Unsupported message type: " + msgType)
 					log.Println("Triggered by " + options.Prompt + ", response: " + message.Raw)
 				}
-			} else if data.Get("type").Int() == 2 && data.Get("item.messages").Exists() {
+			case 2:
+				if !data.Get("item.messages").Exists() {
+					continue
+				}
 				message := data.Get("item.messages|@reverse|0")
 				sendSuggestedResponses(message)
 			}
@@ -244,7 +269,8 @@ func (o *Sydney) AskStreamRaw(options AskStreamOptions) <-chan RawMessage {
 		}
 		optionsSets := o.optionsSetMap[o.conversationStyle]
 		if o.noSearch {
-			optionsSets = append(optionsSets, "nosearchall")
+			// clip first, so that append never writes into the backing array shared via optionsSetMap
+			optionsSets = append(slices.Clip(optionsSets), "nosearchall")
 		}
 		chatMessage := ChatMessage{
 			Arguments: []Argument{
@@ -340,7 +366,8 @@ func (o *Sydney) AskStreamRaw(options AskStreamOptions) <-chan RawMessage {
 					return
 				}
 				result := gjson.Parse(msg)
-				if result.Get("type").Int() == 2 && result.Get("item.result.value").String() != "Success" {
+				isFinal := result.Get("type").Int() == 2
+				if isFinal && result.Get("item.result.value").String() != "Success" {
 					msgChan <- RawMessage{
 						Error: errors.New(result.Get("item.result.value").Raw + ": " +
 							result.Get("item.result.message").Raw),
@@ -350,7 +377,7 @@ func (o *Sydney) AskStreamRaw(options AskStreamOptions) <-chan RawMessage {
 				msgChan <- RawMessage{
 					Data: msg,
 				}
-				if result.Get("type").Int() == 2 {
+				if isFinal {
 					// finish the conversation
 					return
 				}
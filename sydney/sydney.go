@@ -50,6 +50,8 @@ func NewSydney(debug bool, cookies map[string]string, proxy string,
 		panic(err)
 	}
 	forwardedIP := "1.0.0." + strconv.Itoa(util.RandIntInclusive(1, 255))
+	// the same cookie header is shared by all requests, so format it only once
+	cookieString := util.FormatCookieString(cookies)
 	return &Sydney{
 		debug:             debug,
 		cookies:           cookies,
@@ -161,7 +163,7 @@ func NewSydney(debug bool, cookies map[string]string, proxy string,
 			"Referer":                     "https://www.bing.com/search?q=Bing+AI&showconv=1",
 			"Referrer-Policy":             "origin-when-cross-origin",
 			"x-forwarded-for":             forwardedIP,
-			"Cookie":                      util.FormatCookieString(cookies),
+			"Cookie":                      cookieString,
 		},
 		headersCreateConversation: map[string]string{
 			"authority":                   "www.bing.com",
@@ -181,7 +183,7 @@ func NewSydney(debug bool, cookies map[string]string, proxy string,
 			"user-agent":                  "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/112.0.0.0 Safari/537.36 Edg/112.0.1722.46",
 			"x-edge-shopping-flag":        "1",
 			"x-forwarded-for":             forwardedIP,
-			"Cookie":                      util.FormatCookieString(cookies),
+			"Cookie":                      cookieString,
 		},
 		headersCreateImage: map[string]string{
 			"authority":                 "www.bing.com",
@@ -193,7 +195,7 @@ func NewSydney(debug bool, cookies map[string]string, proxy string,
 			"user-agent":                "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/112.0.0.0 Safari/537.36 Edg/112.0.1722.46",
 			"x-forwarded-for":           forwardedIP,
 			"Sec-Fetch-Dest":            "iframe",
-			"Cookie":                    util.FormatCookieString(cookies),
+			"Cookie":                    cookieString,
 		},
 	}
 }
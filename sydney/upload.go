@@ -5,23 +5,56 @@ import (
 	"encoding/base64"
 	"encoding/json"
 	"errors"
-	"github.com/go-resty/resty/v2"
-	"strings"
+	"io"
+	"mime/multipart"
+	"net/http"
+	"net/textproto"
 	"sydneyqt/util"
 	"time"
 )
 
 func (o *Sydney) UploadImage(jpgImgData []byte) (string, error) {
-	httpClient, err := util.MakeHTTPClient(o.proxy, 0)
+	payload, err := o.uploadImagePayload()
 	if err != nil {
 		return "", err
 	}
-	client := resty.New().
-		SetTransport(httpClient.Transport).
-		SetTimeout(60*time.Second).
-		SetHeader("Referer", "https://www.bing.com/search?q=Bing+AI&showconv=1&FORM=hpcodx")
-	imageBase64 := base64.StdEncoding.EncodeToString(jpgImgData)
-	uploadImagePayload := UploadImagePayload{
+	// the size is known, so build the whole body up front and send it with a Content-Length
+	var body bytes.Buffer
+	multipartWriter := multipart.NewWriter(&body)
+	err = writeUploadImageBody(multipartWriter, payload, bytes.NewReader(jpgImgData))
+	if err != nil {
+		return "", err
+	}
+	return o.uploadImage(&body, multipartWriter.FormDataContentType(), int64(body.Len()))
+}
+
+// UploadImageReader streams the image to Bing, base64-encoding it on the fly,
+// so neither the raw image nor its encoded form is ever held in memory as a whole.
+// `size` is the length of the image in bytes and is used to send a Content-Length;
+// pass -1 if it is unknown, in which case the body is sent with chunked transfer encoding.
+func (o *Sydney) UploadImageReader(img io.Reader, size int64) (string, error) {
+	payload, err := o.uploadImagePayload()
+	if err != nil {
+		return "", err
+	}
+	body, bodyWriter := io.Pipe()
+	// unblocks the writer if the request stops reading early
+	defer body.Close()
+	multipartWriter := multipart.NewWriter(bodyWriter)
+	contentLength := int64(-1)
+	if size >= 0 {
+		contentLength, err = uploadImageContentLength(multipartWriter.Boundary(), payload, size)
+		if err != nil {
+			return "", err
+		}
+	}
+	go func() {
+		bodyWriter.CloseWithError(writeUploadImageBody(multipartWriter, payload, img))
+	}()
+	return o.uploadImage(body, multipartWriter.FormDataContentType(), contentLength)
+}
+func (o *Sydney) uploadImagePayload() ([]byte, error) {
+	return json.Marshal(UploadImagePayload{
 		ImageInfo: map[string]any{},
 		KnowledgeRequest: KnowledgeRequest{
 			InvokedSkills:  []string{"ImageById"},
@@ -34,22 +67,35 @@ func (o *Sydney) UploadImage(jpgImgData []byte) (string, error) {
 				Convotone: o.conversationStyle,
 			},
 		},
+	})
+}
+func (o *Sydney) uploadImage(body io.Reader, contentType string, contentLength int64) (string, error) {
+	client, err := util.MakeHTTPClient(o.proxy, 60*time.Second)
+	if err != nil {
+		return "", err
 	}
-	payload, err := json.Marshal(uploadImagePayload)
+	req, err := http.NewRequest(http.MethodPost, "https://www.bing.com/images/kblob", body)
 	if err != nil {
 		return "", err
 	}
-	resp, err := client.R().SetMultipartFields(&resty.MultipartField{
-		Param:       "knowledgeRequest",
-		ContentType: "application/json",
-		Reader:      bytes.NewReader(payload),
-	}, &resty.MultipartField{
-		Param:       "imageBase64",
-		ContentType: "application/octet-stream",
-		Reader:      strings.NewReader(imageBase64),
-	}).Post("https://www.bing.com/images/kblob")
+	if contentLength >= 0 {
+		req.ContentLength = contentLength
+	}
+	req.Header.Set("Content-Type", contentType)
+	req.Header.Set("Referer", "https://www.bing.com/search?q=Bing+AI&showconv=1&FORM=hpcodx")
+	resp, err := client.Do(req)
+	if err != nil {
+		return "", err
+	}
+	defer resp.Body.Close()
+	if resp.StatusCode != http.StatusOK {
+		return "", &util.HTTPStatusError{
+			StatusCode: resp.StatusCode,
+			Message:    "failed to upload image: " + resp.Status,
+		}
+	}
 	var result UploadImageResponse
-	err = json.Unmarshal(resp.Body(), &result)
+	err = json.NewDecoder(resp.Body).Decode(&result)
 	if err != nil {
 		return "", err
 	}
@@ -58,3 +104,49 @@ func (o *Sydney) UploadImage(jpgImgData []byte) (string, error) {
 	}
 	return "https://www.bing.com/images/blob?bcid=" + result.BlobId, nil
 }
+func writeUploadImageBody(w *multipart.Writer, payload []byte, img io.Reader) error {
+	part, err := createFormPart(w, "knowledgeRequest", "application/json")
+	if err != nil {
+		return err
+	}
+	_, err = part.Write(payload)
+	if err != nil {
+		return err
+	}
+	part, err = createFormPart(w, "imageBase64", "application/octet-stream")
+	if err != nil {
+		return err
+	}
+	encoder := base64.NewEncoder(base64.StdEncoding, part)
+	_, err = io.Copy(encoder, img)
+	if err != nil {
+		return err
+	}
+	err = encoder.Close()
+	if err != nil {
+		return err
+	}
+	return w.Close()
+}
+
+// uploadImageContentLength returns the length of the body written by writeUploadImageBody
+// for an image of `size` bytes: the multipart framing plus the base64-encoded image.
+func uploadImageContentLength(boundary string, payload []byte, size int64) (int64, error) {
+	var framing bytes.Buffer
+	w := multipart.NewWriter(&framing)
+	err := w.SetBoundary(boundary)
+	if err != nil {
+		return 0, err
+	}
+	err = writeUploadImageBody(w, payload, bytes.NewReader(nil))
+	if err != nil {
+		return 0, err
+	}
+	return int64(framing.Len()) + 4*((size+2)/3), nil
+}
+func createFormPart(w *multipart.Writer, name string, contentType string) (io.Writer, error) {
+	header := textproto.MIMEHeader{}
+	header.Set("Content-Disposition", `form-data; name="`+name+`"`)
+	header.Set("Content-Type", contentType)
+	return w.CreatePart(header)
+}
@@ -0,0 +1,23 @@
+package sydney
+
+import (
+	"bytes"
+	"mime/multipart"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+)
+
+func TestUploadImageContentLength(t *testing.T) {
+	payload := []byte(`{"knowledgeRequest":{}}`)
+	for _, size := range []int{0, 1, 2, 3, 4, 100000} {
+		var body bytes.Buffer
+		w := multipart.NewWriter(&body)
+		err := writeUploadImageBody(w, payload, bytes.NewReader(make([]byte, size)))
+		assert.Nil(t, err)
+
+		length, err := uploadImageContentLength(w.Boundary(), payload, int64(size))
+		assert.Nil(t, err)
+		assert.Equal(t, int64(body.Len()), length)
+	}
+}
@@ -6,12 +6,13 @@ import (
 	"strings"
 )
 
+var chatMessageRegexp = regexp2.MustCompile(`\[(system|user|assistant)]\(#(.*?)\)([\s\S]*?)(?=\n.*?(^\[(system|user|assistant)]\(#.*?\)))`,
+	regexp2.IgnoreCase|regexp2.Multiline)
+
 func GetOpenAIChatMessages(chatContext string) []openai.ChatCompletionMessage {
 	ctx := chatContext + "\n\n[system](#sydney__placeholder)"
-	re := regexp2.MustCompile(`\[(system|user|assistant)]\(#(.*?)\)([\s\S]*?)(?=\n.*?(^\[(system|user|assistant)]\(#.*?\)))`,
-		regexp2.IgnoreCase|regexp2.Multiline)
 	var result []openai.ChatCompletionMessage
-	match, err := re.FindStringMatch(ctx)
+	match, err := chatMessageRegexp.FindStringMatch(ctx)
 	if err != nil {
 		panic(err)
 	}
@@ -28,7 +29,7 @@ func GetOpenAIChatMessages(chatContext string) []openai.ChatCompletionMessage {
 			Role:    groups[1].String(),
 			Content: content,
 		})
-		match, err = re.FindNextMatch(match)
+		match, err = chatMessageRegexp.FindNextMatch(match)
 		if err != nil {
 			panic(err)
 		}
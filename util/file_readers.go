@@ -19,6 +19,17 @@ import (
 	"time"
 )
 
+var (
+	slideRegexp        = regexp.MustCompile("slide(\\d+)\\.xml")
+	multiNewlineRegexp = regexp.MustCompile("\n+")
+)
+
+// NormalizeNewlines removes carriage returns and collapses runs of newlines into one
+func NormalizeNewlines(text string) string {
+	text = strings.ReplaceAll(text, "\r", "")
+	return multiNewlineRegexp.ReplaceAllString(text, "\n")
+}
+
 type DocumentReader interface {
 	Read(filePath string) (string, error)
 	WillSkipPostprocess() bool
@@ -137,13 +148,12 @@ func (p PptxDocumentReader) Read(filePath string) (string, error) {
 	}
 	defer reader.Close()
 	var slides []Slide
-	slideReg := regexp.MustCompile("slide(\\d+)\\.xml")
 	policy := bluemonday.StripTagsPolicy()
 	for _, file := range reader.File {
 		if !strings.HasPrefix(file.Name, "ppt/slides/") || strings.HasSuffix(file.Name, ".rels") {
 			continue
 		}
-		arr := slideReg.FindStringSubmatch(file.Name)
+		arr := slideRegexp.FindStringSubmatch(file.Name)
 		if len(arr) < 2 {
 			return "", errors.New("file is not a slide xml: " + file.Name)
 		}
@@ -163,9 +173,7 @@ func (p PptxDocumentReader) Read(filePath string) (string, error) {
 		text := string(v)
 		text = strings.ReplaceAll(text, "<a:p>", "\n<a:p>")
 		text = policy.Sanitize(text)
-		text = strings.ReplaceAll(text, "\r", "")
-		text = regexp.MustCompile("(?m)^\r+").ReplaceAllString(text, "")
-		text = regexp.MustCompile("\n+").ReplaceAllString(text, "\n")
+		text = NormalizeNewlines(text)
 		slides = append(slides, Slide{
 			Page:    page,
 			Content: text,
@@ -3,6 +3,7 @@ package util
 import (
 	"bytes"
 	"context"
+	crand "crypto/rand"
 	"crypto/tls"
 	"encoding/hex"
 	"encoding/json"
@@ -17,9 +18,11 @@ import (
 	"io"
 	"log"
 	"math/rand"
+	"net"
 	"net/http"
 	"net/url"
 	"os"
+	"strings"
 	"time"
 )
 
@@ -81,12 +84,60 @@ func MakeHTTPClient(proxy string, timeout time.Duration) (*http.Client, error) {
 	return client, nil
 }
 func FormatCookieString(cookies map[string]string) string {
-	str := ""
+	var builder strings.Builder
 	for k, v := range cookies {
-		str += k + "=" + url.PathEscape(v) + "; "
+		builder.WriteString(k)
+		builder.WriteString("=")
+		builder.WriteString(url.PathEscape(v))
+		builder.WriteString("; ")
 	}
-	return str
+	return builder.String()
 }
+
+// HTTPStatusError is returned when a request is answered with an unexpected status code
+type HTTPStatusError struct {
+	StatusCode int
+	Message    string
+}
+
+func (e *HTTPStatusError) Error() string {
+	return e.Message
+}
+
+// IsTransientError reports whether err is worth retrying:
+// network errors, and 5xx or 429 responses
+func IsTransientError(err error) bool {
+	var statusErr *HTTPStatusError
+	if errors.As(err, &statusErr) {
+		return statusErr.StatusCode >= http.StatusInternalServerError ||
+			statusErr.StatusCode == http.StatusTooManyRequests
+	}
+	var netErr net.Error
+	return errors.As(err, &netErr)
+}
+
+// base delay of Retry, doubled after each failed attempt
+var retryDelay = time.Second
+
+// Retry calls fn up to `attempts` times while it fails with a transient error,
+// waiting 1s, 2s, 4s... between attempts. Other errors are returned immediately,
+// and the wait is abandoned once ctx is done.
+func Retry[T any](ctx context.Context, attempts int, fn func() (T, error)) (T, error) {
+	for i := 0; ; i++ {
+		result, err := fn()
+		if err == nil || i == attempts-1 || !IsTransientError(err) {
+			return result, err
+		}
+		timer := time.NewTimer(retryDelay << i)
+		select {
+		case <-ctx.Done():
+			timer.Stop()
+			return result, ctx.Err()
+		case <-timer.C:
+		}
+	}
+}
+
 func CopyMap[T comparable, E any](source map[T]E) map[T]E {
 	res := map[T]E{}
 	for k, v := range source {
@@ -102,7 +153,8 @@ func CreateCancelContext() (context.Context, context.CancelFunc) {
 }
 func MustGenerateRandomHex(length int) string {
 	randomBytes := make([]byte, length)
-	_, err := rand.New(rand.NewSource(time.Now().Unix())).Read(randomBytes)
+	// read directly instead of allocating and seeding a new math/rand source per call
+	_, err := crand.Read(randomBytes)
 	if err != nil {
 		panic(err)
 	}
@@ -173,18 +225,6 @@ func ConvertImageToJpg(img []byte) ([]byte, error) {
 	return buf.Bytes(), nil
 }
 func GenerateSecMSGec() string {
-	// Create a new local random generator
-	src := rand.NewSource(time.Now().UnixNano())
-	rng := rand.New(src)
-
-	// Create a byte slice of length 32
-	randomBytes := make([]byte, 32)
-
-	// Fill the slice with random bytes
-	for i := range randomBytes {
-		randomBytes[i] = byte(rng.Intn(256))
-	}
-
-	// Convert to hexadecimal
-	return hex.EncodeToString(randomBytes)
+	// 32 random bytes in hexadecimal
+	return MustGenerateRandomHex(32)
 }
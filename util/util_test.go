@@ -0,0 +1,77 @@
+package util
+
+import (
+	"context"
+	"errors"
+	"net"
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+)
+
+func TestRetry(t *testing.T) {
+	retryDelay = 10 * time.Millisecond
+	defer func() { retryDelay = time.Second }()
+	transientErr := &net.OpError{Op: "dial", Err: errors.New("connection refused")}
+
+	t.Run("returns on success", func(t *testing.T) {
+		calls := 0
+		result, err := Retry(context.Background(), 3, func() (string, error) {
+			calls++
+			return "ok", nil
+		})
+		assert.Nil(t, err)
+		assert.Equal(t, "ok", result)
+		assert.Equal(t, 1, calls)
+	})
+	t.Run("retries transient errors with backoff", func(t *testing.T) {
+		calls := 0
+		start := time.Now()
+		result, err := Retry(context.Background(), 3, func() (string, error) {
+			calls++
+			if calls < 3 {
+				return "", transientErr
+			}
+			return "ok", nil
+		})
+		assert.Nil(t, err)
+		assert.Equal(t, "ok", result)
+		assert.Equal(t, 3, calls)
+		// waited 10ms, then 20ms
+		assert.GreaterOrEqual(t, time.Since(start), 30*time.Millisecond)
+	})
+	t.Run("gives up after the last attempt", func(t *testing.T) {
+		calls := 0
+		_, err := Retry(context.Background(), 3, func() (string, error) {
+			calls++
+			return "", &HTTPStatusError{StatusCode: 503, Message: "unavailable"}
+		})
+		assert.Equal(t, "unavailable", err.Error())
+		assert.Equal(t, 3, calls)
+	})
+	t.Run("returns permanent errors immediately", func(t *testing.T) {
+		calls := 0
+		_, err := Retry(context.Background(), 3, func() (string, error) {
+			calls++
+			return "", &HTTPStatusError{StatusCode: 401, Message: "Authentication failed"}
+		})
+		assert.Equal(t, "Authentication failed", err.Error())
+		assert.Equal(t, 1, calls)
+	})
+	t.Run("stops waiting when canceled", func(t *testing.T) {
+		ctx, cancel := context.WithCancel(context.Background())
+		calls := 0
+		_, err := Retry(ctx, 3, func() (string, error) {
+			calls++
+			cancel()
+			return "", transientErr
+		})
+		assert.ErrorIs(t, err, context.Canceled)
+		assert.Equal(t, 1, calls)
+	})
+}
+
+func TestNormalizeNewlines(t *testing.T) {
+	assert.Equal(t, "a\nb\nc\n", NormalizeNewlines("a\r\n\r\nb\n\n\nc\r\n"))
+}
@@ -0,0 +1,54 @@
+package main
+
+import (
+	"errors"
+	"fmt"
+	"io"
+	"mime"
+	"net/http"
+	"strings"
+)
+
+// The largest image accepted by /image/upload/raw
+const MaxRawImageSize = 16 << 20
+
+// ImageUploader uploads `img` of `size` bytes (-1 if unknown) and returns its URL
+type ImageUploader func(r *http.Request, img io.Reader, size int64) (string, error)
+
+// NewRawImageUploadHandler handles uploads whose body is the image itself, so no multipart parsing is needed
+func NewRawImageUploadHandler(upload ImageUploader) http.HandlerFunc {
+	return func(w http.ResponseWriter, r *http.Request) {
+		// only accept images
+		mediaType, _, _ := mime.ParseMediaType(r.Header.Get("Content-Type"))
+		if !strings.HasPrefix(mediaType, "image/") && mediaType != "application/octet-stream" {
+			http.Error(w, "unsupported content type: "+mediaType, http.StatusUnsupportedMediaType)
+			return
+		}
+
+		// limit the size, like /image/upload
+		if r.ContentLength > MaxRawImageSize {
+			http.Error(w, "image is too large", http.StatusRequestEntityTooLarge)
+			return
+		}
+		body := http.MaxBytesReader(w, r.Body, MaxRawImageSize)
+
+		// upload image
+		imgUrl, err := upload(r, body, r.ContentLength)
+
+		if err != nil {
+			var maxBytesErr *http.MaxBytesError
+			if errors.As(err, &maxBytesErr) {
+				http.Error(w, "image is too large", http.StatusRequestEntityTooLarge)
+				return
+			}
+			http.Error(w, err.Error(), http.StatusInternalServerError)
+			return
+		}
+
+		// set headers
+		w.Header().Set("Content-Type", "text/plain")
+
+		// write response
+		fmt.Fprint(w, imgUrl)
+	}
+}
@@ -0,0 +1,62 @@
+package main
+
+import (
+	"bytes"
+	"io"
+	"net/http"
+	"net/http/httptest"
+	"strings"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+)
+
+func TestRawImageUploadHandler(t *testing.T) {
+	var uploaded []byte
+	var uploadedSize int64
+	handler := NewRawImageUploadHandler(func(r *http.Request, img io.Reader, size int64) (string, error) {
+		v, err := io.ReadAll(img)
+		if err != nil {
+			return "", err
+		}
+		uploaded, uploadedSize = v, size
+		return "https://www.bing.com/images/blob?bcid=test", nil
+	})
+	upload := func(contentType string, body io.Reader) *httptest.ResponseRecorder {
+		uploaded, uploadedSize = nil, 0
+		request := httptest.NewRequest(http.MethodPost, "/image/upload/raw", body)
+		request.Header.Set("Content-Type", contentType)
+		recorder := httptest.NewRecorder()
+		handler(recorder, request)
+		return recorder
+	}
+
+	t.Run("image", func(t *testing.T) {
+		recorder := upload("image/jpeg", bytes.NewReader([]byte("jpeg")))
+		assert.Equal(t, http.StatusOK, recorder.Code)
+		assert.Equal(t, "https://www.bing.com/images/blob?bcid=test", recorder.Body.String())
+		assert.Equal(t, []byte("jpeg"), uploaded)
+		assert.Equal(t, int64(4), uploadedSize)
+	})
+	t.Run("octet stream", func(t *testing.T) {
+		recorder := upload("application/octet-stream", bytes.NewReader([]byte("png")))
+		assert.Equal(t, http.StatusOK, recorder.Code)
+		assert.Equal(t, []byte("png"), uploaded)
+	})
+	t.Run("unsupported content type", func(t *testing.T) {
+		recorder := upload("application/json", strings.NewReader(`{}`))
+		assert.Equal(t, http.StatusUnsupportedMediaType, recorder.Code)
+		assert.Nil(t, uploaded)
+	})
+	t.Run("too large", func(t *testing.T) {
+		recorder := upload("image/png", bytes.NewReader(make([]byte, MaxRawImageSize+1)))
+		assert.Equal(t, http.StatusRequestEntityTooLarge, recorder.Code)
+		assert.Nil(t, uploaded)
+	})
+	t.Run("too large without content length", func(t *testing.T) {
+		// io.MultiReader hides the length, so the limit is only hit while reading
+		recorder := upload("image/png", io.MultiReader(bytes.NewReader(make([]byte, MaxRawImageSize+1))))
+		assert.Equal(t, http.StatusRequestEntityTooLarge, recorder.Code)
+		assert.Nil(t, uploaded)
+	})
+}
@@ -47,6 +47,17 @@ type OpenAIMessage struct {
 	Content interface{} `json:"content"`
 }
 
+type OpenAIImageURL struct {
+	URL string `json:"url"`
+}
+
+// An element of the `content` array
+type OpenAIMessageContentPart struct {
+	Type     string          `json:"type"`
+	Text     string          `json:"text,omitempty"`
+	ImageURL *OpenAIImageURL `json:"image_url,omitempty"`
+}
+
 type OpenAIMessagesParseResult struct {
 	WebpageContext string
 	Prompt         string
@@ -61,6 +72,15 @@ type OpenAIChatCompletionRequest struct {
 	Conversation sydney.CreateConversationResponse `json:"conversation,omitempty"`
 }
 
+type OpenAIError struct {
+	Message string `json:"message"`
+	Type    string `json:"type"`
+}
+
+type OpenAIErrorResponse struct {
+	Error OpenAIError `json:"error"`
+}
+
 type ChoiceDelta struct {
 	Role    string `json:"role"`
 	Content string `json:"content"`
@@ -1,7 +1,10 @@
 package main
 
 import (
+	"bytes"
+	"encoding/json"
 	"errors"
+	"net/http"
 	"strings"
 	"time"
 )
@@ -12,6 +15,39 @@ var (
 	FinishReasonLength = "length"
 )
 
+// UnmarshalJSON decodes `content` straight into a string or []OpenAIMessageContentPart,
+// instead of building generic maps that have to be type-asserted afterwards.
+func (m *OpenAIMessage) UnmarshalJSON(data []byte) error {
+	var raw struct {
+		Role    string          `json:"role"`
+		Content json.RawMessage `json:"content"`
+	}
+	if err := json.Unmarshal(data, &raw); err != nil {
+		return err
+	}
+
+	m.Role = raw.Role
+	m.Content = nil
+
+	switch content := bytes.TrimSpace(raw.Content); {
+	case len(content) == 0 || bytes.Equal(content, []byte("null")):
+	case content[0] == '[':
+		var parts []OpenAIMessageContentPart
+		if err := json.Unmarshal(content, &parts); err != nil {
+			return err
+		}
+		m.Content = parts
+	default:
+		var text string
+		if err := json.Unmarshal(content, &text); err != nil {
+			return err
+		}
+		m.Content = text
+	}
+
+	return nil
+}
+
 func ParseOpenAIMessages(messages []OpenAIMessage) (OpenAIMessagesParseResult, error) {
 	if len(messages) == 0 {
 		return OpenAIMessagesParseResult{}, nil
@@ -34,6 +70,8 @@ func ParseOpenAIMessages(messages []OpenAIMessage) (OpenAIMessagesParseResult, e
 
 	// construct context
 	var contextBuilder strings.Builder
+	// rough estimate that saves the first few regrowths, the builder still grows if needed
+	contextBuilder.Grow(len(messages) * 128)
 	contextBuilder.WriteString("\n\n")
 
 	for i, message := range messages[:len(messages)-1] {
@@ -71,17 +109,15 @@ func ParseOpenAIMessageContent(content interface{}) (text, imageUrl string) {
 	case string:
 		// content is string, and it automatically becomes prompt
 		text = content
-	case []map[string]interface{}:
-		// content is array of objects, and it contains prompt and optional image url
-		for _, content := range content {
-			switch content["type"] {
+	case []OpenAIMessageContentPart:
+		// content is array of typed parts, and it contains prompt and optional image url
+		for _, part := range content {
+			switch part.Type {
 			case "text":
-				if contentText, ok := content["text"].(string); ok {
-					text = contentText
-				}
+				text = part.Text
 			case "image_url":
-				if url, ok := content["image_url"].(map[string]string); ok {
-					imageUrl = url["url"]
+				if part.ImageURL != nil {
+					imageUrl = part.ImageURL.URL
 				}
 			}
 		}
@@ -90,6 +126,24 @@ func ParseOpenAIMessageContent(content interface{}) (text, imageUrl string) {
 	return
 }
 
+// WriteOpenAIError writes an error in the format of the OpenAI API, so that its SDKs can parse it
+func WriteOpenAIError(w http.ResponseWriter, message string, code int) {
+	errType := "invalid_request_error"
+	if code >= http.StatusInternalServerError {
+		errType = "server_error"
+	}
+
+	w.Header().Set("Content-Type", "application/json")
+	w.WriteHeader(code)
+
+	json.NewEncoder(w).Encode(OpenAIErrorResponse{
+		Error: OpenAIError{
+			Message: message,
+			Type:    errType,
+		},
+	})
+}
+
 func NewOpenAIChatCompletion(model, content, finishReason string) *OpenAIChatCompletion {
 	return &OpenAIChatCompletion{
 		ID:                "chatcmpl-123",
@@ -1,6 +1,9 @@
 package main
 
 import (
+	"encoding/json"
+	"net/http"
+	"net/http/httptest"
 	"testing"
 
 	"github.com/stretchr/testify/assert"
@@ -41,15 +44,15 @@ func TestParseOpenAIMessages(t *testing.T) {
 			},
 			{
 				Role: "user",
-				Content: []map[string]interface{}{
+				Content: []OpenAIMessageContentPart{
 					{
-						"type": "text",
-						"text": "How are you?",
+						Type: "text",
+						Text: "How are you?",
 					},
 					{
-						"type": "image_url",
-						"image_url": map[string]string{
-							"url": "https://example.com/image.jpg",
+						Type: "image_url",
+						ImageURL: &OpenAIImageURL{
+							URL: "https://example.com/image.jpg",
 						},
 					},
 				},
@@ -63,4 +66,41 @@ func TestParseOpenAIMessages(t *testing.T) {
 			ImageURL:       "https://example.com/image.jpg",
 		}, result)
 	})
+	t.Run("decoded from json", func(t *testing.T) {
+		var request OpenAIChatCompletionRequest
+		err := json.Unmarshal([]byte(`{
+			"model": "gpt-4",
+			"messages": [
+				{"role": "system", "content": "You are Sydney."},
+				{"role": "user", "content": [
+					{"type": "text", "text": "How are you?"},
+					{"type": "image_url", "image_url": {"url": "https://example.com/image.jpg"}}
+				]}
+			]
+		}`), &request)
+		assert.Nil(t, err)
+		result, err := ParseOpenAIMessages(request.Messages)
+		assert.Nil(t, err)
+		assert.Equal(t, OpenAIMessagesParseResult{
+			Prompt:         "How are you?",
+			WebpageContext: "\n\n[system](#additional_instructions)\nYou are Sydney.",
+			ImageURL:       "https://example.com/image.jpg",
+		}, result)
+	})
+}
+
+func TestWriteOpenAIError(t *testing.T) {
+	recorder := httptest.NewRecorder()
+	WriteOpenAIError(recorder, "user prompt is missing", http.StatusBadRequest)
+
+	assert.Equal(t, http.StatusBadRequest, recorder.Code)
+	assert.Equal(t, "application/json", recorder.Header().Get("Content-Type"))
+	assert.Equal(t, `{"error":{"message":"user prompt is missing","type":"invalid_request_error"}}`+"\n",
+		recorder.Body.String())
+}
+
+func TestOpenAIMessageContentPart(t *testing.T) {
+	v, err := json.Marshal(OpenAIMessageContentPart{Type: "text", Text: "Hello!"})
+	assert.Nil(t, err)
+	assert.Equal(t, `{"type":"text","text":"Hello!"}`, string(v))
 }
@@ -1,16 +1,82 @@
 package main
 
 import (
+	"bytes"
+	"encoding/json"
+	"io"
+	"net/http"
 	"strings"
 )
 
 func ParseCookies(cookiesStr string) map[string]string {
-	cookies := map[string]string{}
-	for _, cookie := range strings.Split(cookiesStr, ";") {
-		parts := strings.Split(cookie, "=")
-		if len(parts) == 2 {
-			cookies[parts[0]] = parts[1]
+	cookies := make(map[string]string, strings.Count(cookiesStr, ";")+1)
+	for cookiesStr != "" {
+		var cookie string
+		cookie, cookiesStr, _ = strings.Cut(cookiesStr, ";")
+		// only the first "=" separates name and value
+		name, value, ok := strings.Cut(cookie, "=")
+		if name = strings.TrimSpace(name); ok && name != "" {
+			cookies[name] = strings.TrimSpace(value)
 		}
 	}
 	return cookies
 }
+
+// SSEWriter writes server-sent events to a response.
+// Each event is formatted into a reused buffer and sent with a single write and flush.
+type SSEWriter struct {
+	w       io.Writer
+	flusher http.Flusher
+	buf     bytes.Buffer
+	encoder *json.Encoder
+}
+
+func NewSSEWriter(w http.ResponseWriter) *SSEWriter {
+	sse := &SSEWriter{w: w}
+	sse.flusher, _ = w.(http.Flusher)
+	sse.encoder = json.NewEncoder(&sse.buf)
+	sse.encoder.SetEscapeHTML(false)
+	return sse
+}
+
+// WriteEvent writes an event named `event` with `data` encoded as JSON
+func (s *SSEWriter) WriteEvent(event string, data any) error {
+	s.buf.Reset()
+	s.buf.WriteString("event: ")
+	s.buf.WriteString(event)
+	s.buf.WriteString("\ndata: ")
+	return s.writeFrame(data)
+}
+
+// WriteData writes an unnamed event with `data` encoded as JSON
+func (s *SSEWriter) WriteData(data any) error {
+	s.buf.Reset()
+	s.buf.WriteString("data: ")
+	return s.writeFrame(data)
+}
+
+// WriteDone writes the `[DONE]` message that ends an OpenAI stream
+func (s *SSEWriter) WriteDone() error {
+	s.buf.Reset()
+	s.buf.WriteString("data: [DONE]\n\n")
+	return s.flush()
+}
+
+func (s *SSEWriter) writeFrame(data any) error {
+	// Encode appends the first newline of the frame
+	if err := s.encoder.Encode(data); err != nil {
+		return err
+	}
+	s.buf.WriteByte('\n')
+	return s.flush()
+}
+
+func (s *SSEWriter) flush() error {
+	if _, err := s.w.Write(s.buf.Bytes()); err != nil {
+		return err
+	}
+	if s.flusher != nil {
+		s.flusher.Flush()
+	}
+	return nil
+}
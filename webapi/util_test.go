@@ -0,0 +1,31 @@
+package main
+
+import (
+	"net/http/httptest"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+)
+
+func TestParseCookies(t *testing.T) {
+	assert.Equal(t, map[string]string{}, ParseCookies(""))
+	assert.Equal(t, map[string]string{
+		"_U":         "abc",
+		"SRCHHPGUSR": "SRCHLANG=en&IG=1",
+		"MUID":       "",
+	}, ParseCookies("_U=abc; SRCHHPGUSR=SRCHLANG=en&IG=1; MUID=; invalid; =value"))
+}
+
+func TestSSEWriter(t *testing.T) {
+	recorder := httptest.NewRecorder()
+	sse := NewSSEWriter(recorder)
+
+	assert.Nil(t, sse.WriteEvent("message", "<b>Hi</b>"))
+	assert.Nil(t, sse.WriteData(map[string]string{"content": "Hello"}))
+	assert.Nil(t, sse.WriteDone())
+
+	assert.Equal(t, "event: message\ndata: \"<b>Hi</b>\"\n\n"+
+		"data: {\"content\":\"Hello\"}\n\n"+
+		"data: [DONE]\n\n", recorder.Body.String())
+	assert.True(t, recorder.Flushed)
+}
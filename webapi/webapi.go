@@ -70,7 +70,12 @@ func main() {
 				return
 			}
 			if r.Header.Get("Authorization") != "Bearer "+authToken {
-				http.Error(w, "Unauthorized", http.StatusUnauthorized)
+				// OpenAI-compatible endpoints report errors in OpenAI's format
+				if strings.HasPrefix(r.URL.Path, "/v1/") {
+					WriteOpenAIError(w, "Unauthorized", http.StatusUnauthorized)
+				} else {
+					http.Error(w, "Unauthorized", http.StatusUnauthorized)
+				}
 				return
 			}
 			next.ServeHTTP(w, r)
@@ -91,9 +96,9 @@ func main() {
 		cookies := util.Ternary(request.Cookies == "", defaultCookies, ParseCookies(request.Cookies))
 
 		// create conversation
-		conversation, err := sydney.
+		conversation, err := util.Retry(r.Context(), 3, sydney.
 			NewSydney(false, cookies, proxy, "", "", "", "", false).
-			CreateConversation()
+			CreateConversation)
 
 		if err != nil {
 			http.Error(w, err.Error(), http.StatusInternalServerError)
@@ -114,23 +119,17 @@ func main() {
 		cookiesStr := r.FormValue("cookies")
 		cookies := util.Ternary(cookiesStr == "", defaultCookies, ParseCookies(cookiesStr))
 
-		file, _, err := r.FormFile("file")
+		file, header, err := r.FormFile("file")
 		if err != nil {
 			http.Error(w, err.Error(), http.StatusBadRequest)
 			return
 		}
 		defer file.Close()
 
-		bytes, err := io.ReadAll(file)
-		if err != nil {
-			http.Error(w, err.Error(), http.StatusInternalServerError)
-			return
-		}
-
 		// upload image
 		imgUrl, err := sydney.
 			NewSydney(false, cookies, proxy, "Creative", "", "", "", false).
-			UploadImage(bytes)
+			UploadImageReader(file, header.Size)
 
 		if err != nil {
 			http.Error(w, err.Error(), http.StatusInternalServerError)
@@ -144,6 +143,15 @@ func main() {
 		fmt.Fprint(w, imgUrl)
 	})
 
+	r.Post("/image/upload/raw", NewRawImageUploadHandler(func(r *http.Request, img io.Reader, size int64) (string, error) {
+		cookiesStr := r.Header.Get("Cookie")
+		cookies := util.Ternary(cookiesStr == "", defaultCookies, ParseCookies(cookiesStr))
+
+		return sydney.
+			NewSydney(false, cookies, proxy, "Creative", "", "", "", false).
+			UploadImageReader(img, size)
+	}))
+
 	r.Post("/chat/stream", func(w http.ResponseWriter, r *http.Request) {
 		// parse request
 		request := ChatStreamRequest{
@@ -180,12 +188,10 @@ func main() {
 		w.Header().Set("Connection", "keep-alive")
 
 		// write response
+		sse := NewSSEWriter(w)
+
 		for message := range messageCh {
-			encoded, _ := json.Marshal(message.Text)
-			fmt.Fprintf(w, "event: %s\ndata: %s\n\n", message.Type, encoded)
-			if f, ok := w.(http.Flusher); ok {
-				f.Flush()
-			}
+			sse.WriteEvent(message.Type, message.Text)
 		}
 	})
 
@@ -195,13 +201,13 @@ func main() {
 
 		err := json.NewDecoder(r.Body).Decode(&request)
 		if err != nil {
-			http.Error(w, err.Error(), http.StatusBadRequest)
+			WriteOpenAIError(w, err.Error(), http.StatusBadRequest)
 			return
 		}
 
 		parsedMessages, err := ParseOpenAIMessages(request.Messages)
 		if err != nil {
-			http.Error(w, err.Error(), http.StatusBadRequest)
+			WriteOpenAIError(w, err.Error(), http.StatusBadRequest)
 			return
 		}
 
@@ -215,9 +221,9 @@ func main() {
 
 		// create new conversation if not provided
 		if request.Conversation.ConversationId == "" {
-			request.Conversation, err = sydneyAPI.CreateConversation()
+			request.Conversation, err = util.Retry(r.Context(), 3, sydneyAPI.CreateConversation)
 			if err != nil {
-				http.Error(w, "error creating conversation: "+err.Error(), http.StatusInternalServerError)
+				WriteOpenAIError(w, "error creating conversation: "+err.Error(), http.StatusInternalServerError)
 				return
 			}
 		}
@@ -266,6 +272,9 @@ func main() {
 		w.Header().Set("Connection", "keep-alive")
 
 		// write response
+		sse := NewSSEWriter(w)
+		// a single chunk is reused for the whole stream, only its delta changes
+		chunk := NewOpenAIChatCompletionChunk(conversationStyle, "", nil)
 		errored := false
 
 		for message := range messageCh {
@@ -276,27 +285,20 @@ func main() {
 				delta = message.Text
 			case sydney.MessageTypeError:
 				errored = true
-				delta = fmt.Sprintf("`Error: %s`", message.Text)
+				delta = "`Error: " + message.Text + "`"
 			default:
 				continue
 			}
 
-			chunk := NewOpenAIChatCompletionChunk(conversationStyle, delta, nil)
-			encoded, err := json.Marshal(chunk)
-			if err != nil {
-				continue
-			}
-
-			fmt.Fprintf(w, "data: %s\n\n", encoded)
-			if f, ok := w.(http.Flusher); ok {
-				f.Flush()
-			}
+			chunk.Choices[0].Delta.Content = delta
+			sse.WriteData(chunk)
 		}
 
 		// write final chunk
-		chunk := NewOpenAIChatCompletionChunk(conversationStyle, "", util.Ternary(errored, &FinishReasonLength, &FinishReasonStop))
-		encoded, _ := json.Marshal(chunk)
-		fmt.Fprintf(w, "data: %s\n\ndata: [DONE]\n", encoded)
+		chunk.Choices[0].Delta.Content = ""
+		chunk.Choices[0].FinishReason = util.Ternary(errored, &FinishReasonLength, &FinishReasonStop)
+		sse.WriteData(chunk)
+		sse.WriteDone()
 	})
 
 	// serve the router